@@ -0,0 +1,54 @@
+"""
+Benchmark the cost of ``import geoplots``.
+
+Each statement runs in a fresh interpreter, so nothing is cached between runs.
+"eager" imports every submodule and registers the bundled fonts, which is what
+``import geoplots`` did before submodules and fonts were loaded lazily.
+
+    python benchmarks/import_time.py [repeat]
+"""
+
+import os
+import subprocess
+import sys
+import time
+
+STATEMENTS = {
+    'lazy': 'import geoplots',
+    'first name': 'import geoplots; geoplots.boundary_cmap',
+    'eager': 'import geoplots; from geoplots import *; geoplots.register_fonts()',
+}
+
+
+def import_time(statement, repeat=10):
+    """
+    Best wall time of running a statement in a new interpreter.
+
+    Parameters
+    ----------
+    statement : str
+        The Python statement to run.
+    repeat : int, optional
+        The number of runs.
+
+    Returns
+    -------
+    float
+        The best time in seconds, excluding interpreter startup.
+    """
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env = dict(os.environ, PYTHONPATH=root, MPLBACKEND='Agg')
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, '-c', statement], env=env, check=True)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+if __name__ == '__main__':
+    repeat = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    startup = import_time('pass', repeat)
+    for label, statement in STATEMENTS.items():
+        cost = import_time(statement, repeat) - startup
+        print('{:<12}{:8.1f} ms  {}'.format(label, cost * 1000, statement))
@@ -1,17 +1,84 @@
-import os
-import matplotlib.font_manager as fm
-
-_font_dir = os.path.join(os.path.dirname(__file__), 'fonts')
-for font_file in os.listdir(_font_dir):
-    if font_file.endswith('.ttf'):
-        fm.fontManager.addfont(os.path.join(_font_dir, font_file))
-
-from geoplots._const import *
-from geoplots.wrapper import *
-from geoplots.cartopy import *
-from geoplots.bound import *
-from geoplots.legend import *
-from geoplots.boxplot import *
-from geoplots.heatmap import *
-from geoplots.icongrid import *
-from geoplots.color import *
+import importlib
+import sys
+import types
+
+# Public names of each submodule, imported on first attribute access
+_submodule_names = {
+    '_const': ['params'],
+    'wrapper': ['register_fonts', 'init', 'title', 'highlight', 'colorbar', 'tight'],
+    'cartopy': ['cartopy_crs'],
+    'bound': ['set_axis_bound', 'robinson_bound', 'lonlat_bound'],
+    'legend': [
+        'flip',
+        'AnyObject',
+        'AnyObjectHandler',
+        'cat_legend',
+        'category_legend',
+    ],
+    'boxplot': [
+        'stylize_boxplot',
+        'QuantileSketch',
+        'group_stats',
+        'grouped_stats',
+        'stream_boxplot',
+    ],
+    'heatmap': [
+        'heatmap',
+        'clustered_heatmap',
+        'annotate_heatmap',
+        'update_heatmap',
+        'AnnotationLayer',
+        'downsample',
+    ],
+    'icongrid': ['icons', 'Waffle', 'TextLegend', 'TextLegendHandler'],
+    'color': [
+        'rgb2hex',
+        'truncate_colormap',
+        'boundary_cmap',
+        'colormap_cache_info',
+        'colormap_cache_clear',
+        'colormap_lut',
+        'colorize',
+    ],
+}
+_lazy_names = {
+    name: module for module, names in _submodule_names.items() for name in names
+}
+
+__all__ = list(_lazy_names)
+
+
+def __getattr__(name):
+    if name in _lazy_names:
+        module = importlib.import_module('geoplots.' + _lazy_names[name])
+        # bind every name of the submodule, which also replaces the submodule
+        # attribute set by the import when it shares a name, e.g. heatmap
+        for attr in _submodule_names[_lazy_names[name]]:
+            globals()[attr] = getattr(module, attr)
+        if name == 'params':
+            # params sets the bundled Roboto font, also when init is not called
+            __getattr__('register_fonts')()
+        return globals()[name]
+    if name in _submodule_names:
+        return importlib.import_module('geoplots.' + name)
+    raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name))
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_lazy_names) | set(_submodule_names))
+
+
+class _Package(types.ModuleType):
+    def __setattr__(self, name, value):
+        # importing a submodule binds it on the package, which must not
+        # replace the function of the same name, e.g. heatmap
+        if (
+            isinstance(value, types.ModuleType)
+            and value.__name__ == __name__ + '.' + name
+            and name in _lazy_names
+        ):
+            value = getattr(value, name)
+        super().__setattr__(name, value)
+
+
+sys.modules[__name__].__class__ = _Package
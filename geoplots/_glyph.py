@@ -0,0 +1,58 @@
+import numpy as np
+from matplotlib.path import Path
+from matplotlib.textpath import TextPath
+from matplotlib.transforms import Affine2D
+
+
+def glyph_path(s, prop, ha='center', va='center', rotation=0):
+    """
+    Glyph path of a string in points, aligned on the origin.
+
+    The path can be stamped at many offsets of a collection drawn with
+    `glyph_transform`, instead of laying out one `Text` per position.
+
+    Parameters
+    ----------
+    s : str
+        The string.
+    prop : matplotlib.font_manager.FontProperties
+        The font of the string.
+    ha : {'center', 'left', 'right'}, optional
+        The horizontal alignment on the origin (default is 'center').
+    va : {'center', 'bottom', 'top', 'baseline'}, optional
+        The vertical alignment on the origin (default is 'center').
+    rotation : float, optional
+        The rotation in degrees around the origin (default is 0).
+
+    Returns
+    -------
+    matplotlib.path.Path
+        The glyph outline in points, empty for a blank string.
+    """
+    if not s.strip():
+        return Path(np.empty((0, 2)))
+    path = TextPath((0, 0), s, prop=prop)
+    (x0, y0), (x1, y1) = path.get_extents().get_points()
+    dx = {'left': -x0, 'right': -x1}.get(ha, -(x0 + x1) / 2)
+    dy = {'bottom': -y0, 'top': -y1, 'baseline': 0}.get(va, -(y0 + y1) / 2)
+    return path.transformed(Affine2D().translate(dx, dy).rotate_deg(rotation or 0))
+
+
+def glyph_transform(fig):
+    """
+    Transform of glyph paths, which are in points, to pixels of a figure.
+
+    The dpi is read at draw time, so glyphs keep their size when saving at
+    another dpi.
+
+    Parameters
+    ----------
+    fig : matplotlib.figure.Figure
+        The figure drawing the glyphs.
+
+    Returns
+    -------
+    matplotlib.transforms.Transform
+        The transform of a collection of glyph paths.
+    """
+    return Affine2D().scale(1 / 72) + fig.dpi_scale_trans
@@ -1,7 +1,103 @@
+import numpy as np
+from matplotlib import cbook
+from matplotlib.collections import LineCollection, PolyCollection
+from matplotlib.colors import to_rgba_array
 from matplotlib.patches import Polygon
 
 
-def stylize_boxplot(bp, colors):
+def _flier_index(values, max_fliers, flier_mode, rng):
+    # indices of the fliers kept, in their original order
+    n = len(values)
+    if flier_mode == 'random':
+        return np.sort(rng.choice(n, max_fliers, replace=False))
+    # evenly spaced ranks keep both extremes and the density along the axis
+    ranks = np.linspace(0, n - 1, max_fliers).round().astype(np.intp)
+    return np.sort(np.argsort(values, kind='stable')[ranks])
+
+
+def _flier_data(flier, max_fliers, flier_mode, rng):
+    # the flier coordinates, subsampled to max_fliers
+    xdata, ydata = np.asarray(flier.get_xdata()), np.asarray(flier.get_ydata())
+    if max_fliers is not None and len(xdata) > max_fliers:
+        # values lie along y for vertical boxes, along x otherwise
+        values = ydata if np.ptp(ydata) >= np.ptp(xdata) else xdata
+        index = _flier_index(values, max_fliers, flier_mode, rng)
+        xdata, ydata = xdata[index], ydata[index]
+    return xdata, ydata
+
+
+def _line_segment(line):
+    return np.column_stack([line.get_xdata(), line.get_ydata()])
+
+
+def _stylize_batch(bp, colors, max_fliers, flier_mode, rng):
+    # replace the artists of each box by one collection per kind of artist
+    if not bp['boxes']:
+        return
+    ax = bp['boxes'][0].axes
+    n = len(bp['boxes'])
+    colors = to_rgba_array(list(colors)[:n])
+
+    boxes = PolyCollection(
+        [_line_segment(box) for box in bp['boxes']], facecolors=colors, linewidths=0
+    )
+    # two whiskers and two shortened caps per box
+    segments = [_line_segment(whisker) for whisker in bp['whiskers']]
+    for cap in bp['caps']:
+        segment = _line_segment(cap)
+        dx = (segment[1, 0] - segment[0, 0]) / 4
+        segment[:, 0] += (dx, -dx)
+        segments.append(segment)
+    whiskers = LineCollection(
+        segments, colors=np.concatenate([colors.repeat(2, axis=0)] * 2), linewidths=1
+    )
+    medians = LineCollection(
+        [_line_segment(median) for median in bp['medians']],
+        colors='black',
+        linewidths=1,
+    )
+    # bxp pins the axis limits with the sticky edges of the medians
+    for median in bp['medians']:
+        medians.sticky_edges.x.extend(median.sticky_edges.x)
+        medians.sticky_edges.y.extend(median.sticky_edges.y)
+    fliers = []
+    if len(bp['fliers']) > 0:
+        data = [_flier_data(f, max_fliers, flier_mode, rng) for f in bp['fliers']]
+        counts = [len(x) for x, _ in data]
+        fliers = ax.scatter(
+            np.concatenate([x for x, _ in data]),
+            np.concatenate([y for _, y in data]),
+            s=4,
+            c=colors.repeat(counts, axis=0),
+            marker='o',
+            alpha=0.75,
+            edgecolors='none',
+            rasterized=flier_mode == 'raster',
+        )
+        fliers = [fliers]
+
+    # removing in drawing order keeps each search of the children list short
+    removed = {
+        id(artist)
+        for key in ('boxes', 'whiskers', 'caps', 'medians', 'fliers')
+        for artist in bp[key]
+    }
+    for artist in [a for a in ax.get_children() if id(a) in removed]:
+        artist.remove()
+    for collection in (boxes, whiskers, medians):
+        ax.add_collection(collection, autolim=False)
+    bp.update(
+        boxes=[boxes],
+        whiskers=[whiskers],
+        caps=[whiskers],
+        medians=[medians],
+        fliers=fliers,
+    )
+
+
+def stylize_boxplot(
+    bp, colors, max_fliers=None, flier_mode='extreme', seed=0, batch=False
+):
     """
     Apply custom styles to a boxplot.
 
@@ -11,7 +107,28 @@ def stylize_boxplot(bp, colors):
         The dictionary returned by `matplotlib.pyplot.boxplot`.
     colors : list
         A list of colors to apply to the boxes and whiskers.
+    max_fliers : int, optional
+        The largest number of fliers drawn per box.  If None, all are drawn.
+    flier_mode : {'extreme', 'random', 'raster'}, optional
+        How fliers beyond max_fliers are dropped: 'extreme' keeps evenly
+        spaced ranks, including the minimum and maximum, 'random' keeps a
+        random subset.  'raster' additionally rasterizes the fliers, so that
+        vector output embeds them as an image at the savefig dpi (default is
+        'extreme').
+    seed : int, optional
+        Seed of the 'random' subsampling (default is 0).
+    batch : bool, optional
+        If True, replace the artists of the boxes, whiskers and caps, medians
+        and fliers by one collection each, also in bp, where whiskers and
+        caps share theirs.  Much faster with thousands of boxes (default is
+        False).
     """
+    if flier_mode not in ('extreme', 'random', 'raster'):
+        raise ValueError('unknown flier_mode: {!r}'.format(flier_mode))
+    rng = np.random.default_rng(seed)
+    if batch:
+        _stylize_batch(bp, colors, max_fliers, flier_mode, rng)
+        return
     for i, box in enumerate(bp['boxes']):
         # set color for each box
         box.set_linewidth(0)
@@ -27,13 +144,17 @@ def stylize_boxplot(bp, colors):
         bp['whiskers'][i * 2 + 1].set_linewidth(1)
         # top and bottom fliers
         if len(bp['fliers']) > 0:
-            bp['fliers'][i].set(
+            flier = bp['fliers'][i]
+            flier.set(
                 markerfacecolor=colors[i],
                 marker='o',
                 alpha=0.75,
                 markersize=2,
                 markeredgecolor='none',
+                rasterized=flier_mode == 'raster',
             )
+            if max_fliers is not None:
+                flier.set_data(*_flier_data(flier, max_fliers, flier_mode, rng))
         bp['medians'][i].set_color('black')
         bp['medians'][i].set_linewidth(1)
         # and 4 caps to remove
@@ -49,3 +170,341 @@ def stylize_boxplot(bp, colors):
             linewidth=1,
             xdata=bp['caps'][i * 2 + 1].get_xdata() + (dx, -dx),
         )
+
+
+class QuantileSketch(object):
+    """
+    A mergeable quantile sketch of a stream of values.
+
+    Values are kept in levels of weight 1, 2, 4, ...  When a level holds more
+    than size values, it is sorted and every other value, starting at a random
+    offset, is promoted to the next level (a KLL compactor).  The memory is
+    O(size * log(n / size)) and the rank error about n / size.
+
+    Parameters
+    ----------
+    size : int, optional
+        The capacity of each level (default is 4096).
+    seed : int, optional
+        Seed of the random compaction offsets (default is 0).
+    """
+
+    def __init__(self, size=4096, seed=0):
+        self.size = size
+        self.count = 0
+        self.levels = [np.empty(0)]
+        self._rng = np.random.default_rng(seed)
+
+    def update(self, values):
+        """
+        Add values to the sketch.
+        """
+        values = np.asarray(values, dtype=float).ravel()
+        self.count += values.size
+        self.levels[0] = np.concatenate([self.levels[0], values])
+        self._compress()
+
+    def merge(self, other):
+        """
+        Add the values summarized by another sketch.
+        """
+        for i, level in enumerate(other.levels):
+            if i == len(self.levels):
+                self.levels.append(np.empty(0))
+            self.levels[i] = np.concatenate([self.levels[i], level])
+        self.count += other.count
+        self._compress()
+
+    def _compress(self):
+        i = 0
+        while i < len(self.levels):
+            level = self.levels[i]
+            if level.size > self.size:
+                level = np.sort(level)
+                # an odd value out stays at this level
+                keep = level[level.size - level.size % 2 :]
+                promoted = level[self._rng.integers(2) : level.size - keep.size : 2]
+                self.levels[i] = keep
+                if i + 1 == len(self.levels):
+                    self.levels.append(np.empty(0))
+                self.levels[i + 1] = np.concatenate([self.levels[i + 1], promoted])
+            i += 1
+
+    def items(self):
+        """
+        The retained values and their weights.
+
+        Returns
+        -------
+        tuple
+            (values, weights) arrays, sorted by value.
+        """
+        values = np.concatenate(self.levels)
+        weights = np.concatenate(
+            [np.full(level.size, 2**i) for i, level in enumerate(self.levels)]
+        )
+        order = np.argsort(values, kind='stable')
+        return values[order], weights[order]
+
+    def quantile(self, q):
+        """
+        Approximate quantiles of the values.
+
+        Parameters
+        ----------
+        q : float or array-like
+            Quantiles between 0 and 1.
+
+        Returns
+        -------
+        float or numpy.ndarray
+            The values at the quantiles.
+        """
+        values, weights = self.items()
+        if values.size == 0:
+            return np.full(np.shape(q), np.nan)[()]
+        ranks = np.cumsum(weights) - weights / 2
+        return np.interp(np.asarray(q) * weights.sum(), ranks, values)
+
+
+def _chunks(data, chunk_size):
+    # flat float chunks of an array-like, an iterable of chunks or a callable
+    # returning either, without NaN
+    if callable(data):
+        data = data()
+    if hasattr(data, 'shape') and hasattr(data, 'dtype'):
+        flat = data.reshape(-1) if isinstance(data, np.ndarray) else data
+        chunks = (flat[i : i + chunk_size] for i in range(0, len(flat), chunk_size))
+    else:
+        chunks = data
+    for chunk in chunks:
+        chunk = np.asarray(chunk, dtype=float).ravel()
+        yield chunk[~np.isnan(chunk)]
+
+
+def _reiterable(data):
+    return callable(data) or (hasattr(data, 'shape') and hasattr(data, 'dtype'))
+
+
+def group_stats(
+    data, whis=1.5, label=None, max_exact=10**7, chunk_size=2**20, sketch_size=4096
+):
+    """
+    Boxplot statistics of one group of values, read chunk by chunk.
+
+    Up to max_exact values, the chunks are concatenated and the statistics
+    are exact, as in `matplotlib.cbook.boxplot_stats`.  Beyond that the
+    quartiles come from a `QuantileSketch`.  Whiskers and fliers are then
+    exact if data can be read again (an array, a memmap or a callable), and
+    taken from the values kept by the sketch otherwise.  NaN is ignored.
+
+    Parameters
+    ----------
+    data : array-like, iterable or callable
+        The values: an array such as a numpy.memmap, an iterable of chunks,
+        or a callable returning one of these.
+    whis : float or (float, float), optional
+        The whisker reach in IQR, or the percentiles of the whiskers, as in
+        `matplotlib.axes.Axes.boxplot` (default is 1.5).
+    label : str, optional
+        The label of the group.
+    max_exact : int, optional
+        The largest number of values held in memory for exact statistics.
+    chunk_size : int, optional
+        The number of values read at a time from an array.
+    sketch_size : int, optional
+        The size of the `QuantileSketch`.
+
+    Returns
+    -------
+    dict
+        The statistics expected by `matplotlib.axes.Axes.bxp`.
+    """
+    buffered, sketch = [], None
+    count, total = 0, 0.0
+    for chunk in _chunks(data, chunk_size):
+        count += chunk.size
+        total += chunk.sum()
+        if sketch is not None:
+            sketch.update(chunk)
+            continue
+        buffered.append(chunk)
+        if count > max_exact:
+            sketch = QuantileSketch(sketch_size)
+            for b in buffered:
+                sketch.update(b)
+            buffered = None
+
+    if sketch is None:
+        values = np.concatenate(buffered) if buffered else np.empty(0)
+        stats = cbook.boxplot_stats(values, whis=whis, labels=None)[0]
+        if label is not None:
+            stats['label'] = label
+        return stats
+
+    q1, med, q3 = sketch.quantile([0.25, 0.5, 0.75])
+    iqr = q3 - q1
+    if np.iterable(whis):
+        low, high = sketch.quantile(np.asarray(whis) / 100)
+    else:
+        low, high = q1 - whis * iqr, q3 + whis * iqr
+
+    if _reiterable(data):
+        whislo, whishi, fliers = np.inf, -np.inf, []
+        for chunk in _chunks(data, chunk_size):
+            inside = (chunk >= low) & (chunk <= high)
+            whislo = min(whislo, chunk.min(initial=np.inf, where=inside))
+            whishi = max(whishi, chunk.max(initial=-np.inf, where=inside))
+            fliers.append(chunk[~inside])
+        fliers = np.concatenate(fliers)
+    else:
+        values, _ = sketch.items()
+        inside = (values >= low) & (values <= high)
+        whislo, whishi = values[inside][[0, -1]] if inside.any() else (q1, q3)
+        fliers = values[~inside]
+
+    stats = {
+        'mean': total / count,
+        'iqr': iqr,
+        'q1': q1,
+        'med': med,
+        'q3': q3,
+        'cilo': med - 1.57 * iqr / np.sqrt(count),
+        'cihi': med + 1.57 * iqr / np.sqrt(count),
+        'whislo': min(whislo, q1),
+        'whishi': max(whishi, q3),
+        'fliers': fliers,
+    }
+    if label is not None:
+        stats['label'] = label
+    return stats
+
+
+def _exact_stats(values, whis, label):
+    # module level, so that a process pool can pickle it
+    stats = cbook.boxplot_stats(values[~np.isnan(values)], whis=whis)[0]
+    stats['label'] = label
+    return stats
+
+
+def grouped_stats(keys, values, whis=1.5, n_jobs=None, processes=False):
+    """
+    Boxplot statistics of values grouped by keys, computed concurrently.
+
+    The values are sorted by key once, and the exact statistics of each
+    group, as in `matplotlib.cbook.boxplot_stats`, are computed in a pool.
+    Threads suit most cases since numpy releases the GIL while sorting;
+    processes avoid the GIL at the cost of copying each group.  NaN is
+    ignored.
+
+    Parameters
+    ----------
+    keys : array-like
+        The group key of each value.  Values with a NaN or NaT key are
+        dropped.
+    values : array-like
+        The values, of the same length as keys.
+    whis : float or (float, float), optional
+        The whisker reach in IQR, or the percentiles of the whiskers, as in
+        `matplotlib.axes.Axes.boxplot` (default is 1.5).
+    n_jobs : int, optional
+        The number of workers, one if None.
+    processes : bool, optional
+        Use a process pool instead of a thread pool (default is False).
+
+    Returns
+    -------
+    list of dict
+        The statistics of each group, sorted by key and labelled with it,
+        expected by `matplotlib.axes.Axes.bxp`.
+    """
+    keys = np.asarray(keys).ravel()
+    values = np.asarray(values, dtype=float).ravel()
+    if keys.size != values.size:
+        raise ValueError('keys and values must have the same length')
+    # NaN keys are unequal to each other and would each form a group
+    if keys.dtype.kind in 'fc':
+        valid = ~np.isnan(keys)
+    elif keys.dtype.kind in 'mM':
+        valid = ~np.isnat(keys)
+    else:
+        valid = None
+    if valid is not None and not valid.all():
+        keys, values = keys[valid], values[valid]
+
+    sort_keys = keys
+    if keys.dtype.kind in 'iu' and keys.itemsize > 2 and keys.size:
+        low = keys.min()
+        # Python ints, as the span of int64 keys can overflow
+        if int(keys.max()) - int(low) < 2**16:
+            # numpy radix sorts 16-bit integers, far faster than a merge sort
+            sort_keys = (keys - low).astype(np.uint16)
+    order = np.argsort(sort_keys, kind='stable')
+    keys, values = keys[order], values[order]
+    starts = np.flatnonzero(keys[1:] != keys[:-1]) + 1
+    labels = keys[np.r_[0, starts]].tolist() if keys.size else []
+    groups = np.split(values, starts) if keys.size else []
+    whiskers = [whis] * len(groups)
+
+    if n_jobs is None or n_jobs == 1:
+        return list(map(_exact_stats, groups, whiskers, labels))
+    if processes:
+        from concurrent.futures import ProcessPoolExecutor as Executor
+    else:
+        from concurrent.futures import ThreadPoolExecutor as Executor
+
+    with Executor(n_jobs) as executor:
+        return list(executor.map(_exact_stats, groups, whiskers, labels))
+
+
+def stream_boxplot(
+    ax,
+    groups,
+    colors,
+    labels=None,
+    whis=1.5,
+    max_exact=10**7,
+    chunk_size=2**20,
+    sketch_size=4096,
+    max_fliers=None,
+    flier_mode='extreme',
+    batch=False,
+    **kwargs,
+):
+    """
+    Draw a styled boxplot of groups that do not fit in memory.
+
+    The statistics of each group are computed by `group_stats` and drawn with
+    `matplotlib.axes.Axes.bxp`, then styled by `stylize_boxplot`.
+
+    Parameters
+    ----------
+    ax : matplotlib.axes.Axes
+        The axes to draw on.
+    groups : list
+        The values of each group, as accepted by `group_stats`.
+    colors : list
+        A list of colors of the groups.
+    labels : list, optional
+        The labels of the groups.
+    whis, max_exact, chunk_size, sketch_size : optional
+        Arguments of `group_stats`.
+    max_fliers, flier_mode, batch : optional
+        Arguments of `stylize_boxplot`.
+    **kwargs
+        Additional arguments passed to `matplotlib.axes.Axes.bxp`.
+
+    Returns
+    -------
+    dict
+        The artists returned by `matplotlib.axes.Axes.bxp`.
+    """
+    if labels is None:
+        labels = [None] * len(groups)
+    stats = [
+        group_stats(data, whis, label, max_exact, chunk_size, sketch_size)
+        for data, label in zip(groups, labels)
+    ]
+    bp = ax.bxp(stats, **kwargs)
+    stylize_boxplot(bp, colors, max_fliers, flier_mode, batch=batch)
+    return bp
@@ -1,28 +1,94 @@
 import numpy as np
 import matplotlib as mpl
+from functools import lru_cache
+
+# two hexadecimal digits of each channel value
+_HEX_LUT = np.array(['%02x' % i for i in range(256)], dtype=object)
 
 
 def rgb2hex(rgb):
     """
     Convert RGB values to hexadecimal color strings.
 
+    The scale is detected once for the whole array: uint8 and other integer
+    arrays, or float arrays with values above 1, are read as 0-255, other
+    float arrays as 0-1.
+
     Parameters
     ----------
     rgb : list of lists/tuples or numpy.ndarray
-        Array of RGB values (0-1 or 0-255).
+        Array of RGB or RGBA values (0-1 or 0-255), of shape (N, 3) or (N, 4).
+        A single color is also accepted.
 
     Returns
     -------
     list
-        List of hexadecimal color strings.
+        List of hexadecimal color strings, with alpha for RGBA input.
     """
-    return ['#%02x%02x%02x' % tuple((np.array(i) * 1).astype(int)) for i in rgb]
+    rgb = np.atleast_2d(np.asarray(rgb))
+    if rgb.dtype != np.uint8:
+        if rgb.dtype.kind == 'f' and rgb.max(initial=0) <= 1:
+            rgb = rgb * 255
+        rgb = np.clip(np.round(rgb), 0, 255).astype(np.uint8)
+    return list('#' + _HEX_LUT[rgb].sum(axis=1))
+
+
+@lru_cache(maxsize=128)
+def _truncate_colormap(name, minval, maxval, n, colors=None):
+    # colors are the sampled RGBA bytes of an unregistered colormap
+    if colors is None:
+        colors = mpl.colormaps[name](np.linspace(minval, maxval, n))
+    else:
+        colors = np.frombuffer(colors).reshape(-1, 4)
+    return mpl.colors.LinearSegmentedColormap.from_list(
+        f'trunc({name},{minval:.2f},{maxval:.2f},{n})', colors
+    )
+
+
+@lru_cache(maxsize=128)
+def _boundary_cmap(colors, name):
+    return mpl.colors.LinearSegmentedColormap.from_list(
+        name, list(zip(np.linspace(0, 1, len(colors)), colors))
+    )
 
 
-def truncate_colormap(cmap, minval=0.0, maxval=1.0, n=256):
+def _register(cmap):
+    # replace a different colormap registered under the same name
+    if cmap.name not in mpl.colormaps or mpl.colormaps[cmap.name] != cmap:
+        mpl.colormaps.register(cmap, force=True)
+
+
+def colormap_cache_info():
+    """
+    Hits and misses of the caches of `truncate_colormap` and `boundary_cmap`.
+
+    Returns
+    -------
+    dict
+        {function name: functools cache info (hits, misses, maxsize, currsize)}
+    """
+    return {
+        'truncate_colormap': _truncate_colormap.cache_info(),
+        'boundary_cmap': _boundary_cmap.cache_info(),
+    }
+
+
+def colormap_cache_clear():
+    """
+    Clear the caches of `truncate_colormap` and `boundary_cmap`.
+    """
+    _truncate_colormap.cache_clear()
+    _boundary_cmap.cache_clear()
+
+
+def truncate_colormap(cmap, minval=0.0, maxval=1.0, n=256, register=False):
     """
     Truncate a colormap to a specific range.
 
+    Colormaps are cached by their arguments with LRU eviction, and each call
+    returns a copy of the cached colormap, so it can be modified, e.g. with
+    set_under, without affecting other calls.
+
     Parameters
     ----------
     cmap : str or matplotlib.colors.Colormap
@@ -33,39 +99,175 @@ def truncate_colormap(cmap, minval=0.0, maxval=1.0, n=256):
         The upper bound of the new colormap (default is 1.0).
     n : int, optional
         The number of discrete colors in the new colormap (default is 256).
+    register : bool, optional
+        Whether to register the new colormap in `matplotlib.colormaps` under
+        its name, e.g. 'trunc(viridis,0.20,0.80,256)', replacing a colormap
+        of the same name (default is False).
 
     Returns
     -------
     matplotlib.colors.LinearSegmentedColormap
         The truncated colormap.
     """
-    cmap = mpl.colormaps[cmap] if isinstance(cmap, str) else cmap
-    cmap = mpl.colors.LinearSegmentedColormap.from_list(
-        f'trunc({cmap.name},{minval:.2f},{maxval:.2f})',
-        cmap(np.linspace(minval, maxval, n)),
-    )
+    minval, maxval, n = float(minval), float(maxval), int(n)
+    if isinstance(cmap, str):
+        cmap = _truncate_colormap(cmap, minval, maxval, n)
+    else:
+        colors = np.asarray(cmap(np.linspace(minval, maxval, n)), dtype=float)
+        cmap = _truncate_colormap(cmap.name, minval, maxval, n, colors.tobytes())
+    cmap = cmap.copy()
+    if register:
+        _register(cmap)
     return cmap
 
 
-def boundary_cmap(colors, bounds):
+def boundary_cmap(colors, bounds, name='boundary_cmap', register=False):
     """
     Create a colormap and norm for discrete intervals.
 
+    Colormaps are cached by their arguments with LRU eviction, and each call
+    returns a copy of the cached colormap and a new norm, so they can be
+    modified without affecting other calls.
+
     Parameters
     ----------
     colors : list
         List of colors (names, hex, or RGB).
     bounds : list
         List of boundaries for the discrete intervals.
+    name : str, optional
+        The name of the colormap (default is 'boundary_cmap').
+    register : bool, optional
+        Whether to register the colormap in `matplotlib.colormaps` under name,
+        replacing a colormap of the same name (default is False).
 
     Returns
     -------
     tuple
         (cmap, norm) where cmap is the colormap and norm is the BoundaryNorm.
     """
-    colors = [c if isinstance(c, str) else rgb2hex(c) for c in colors]
-    cmap = mpl.colors.LinearSegmentedColormap.from_list(
-        'boundary_cmap', list(zip(np.linspace(0, 1, len(colors)), colors))
-    )
+    colors = list(colors)
+    index = [i for i, c in enumerate(colors) if not isinstance(c, str)]
+    if index:
+        for i, c in zip(index, rgb2hex([colors[i] for i in index])):
+            colors[i] = c
+    cmap = _boundary_cmap(
+        tuple(mpl.colors.to_hex(c, keep_alpha=True) for c in colors), name
+    ).copy()
     norm = mpl.colors.BoundaryNorm(bounds, cmap.N)
+    if register:
+        _register(cmap)
     return cmap, norm
+
+
+def colormap_lut(cmap):
+    """
+    RGBA lookup table of a colormap, with its under, over and bad colors.
+
+    Parameters
+    ----------
+    cmap : str or matplotlib.colors.Colormap
+        The colormap.
+
+    Returns
+    -------
+    numpy.ndarray
+        uint8 array of shape (N + 3, 4): the N colors of cmap followed by the
+        under, over and bad colors.
+    """
+    cmap = mpl.colormaps[cmap] if isinstance(cmap, str) else cmap
+    lut = np.empty((cmap.N + 3, 4), dtype=np.uint8)
+    lut[: cmap.N + 2] = cmap(np.r_[np.arange(cmap.N), -1, cmap.N], bytes=True)
+    lut[cmap.N + 2] = cmap(np.ma.masked_invalid([np.nan]), bytes=True)[0]
+    return lut
+
+
+def colorize(data, cmap, norm=None, chunk_size=2**22, n_jobs=None):
+    """
+    Map a large 2D array to an RGBA uint8 image through a lookup table.
+
+    The colors are looked up in a table precomputed once from cmap, and data is
+    processed a chunk of rows at a time, so no float RGBA copy of the whole
+    array is made.  The result can be given to `imshow` directly, and looks
+    the same as `imshow(data, cmap=cmap, norm=norm)` at full resolution.
+
+    Parameters
+    ----------
+    data : numpy.ndarray
+        The 2D array to colorize, e.g. a numpy.memmap.
+    cmap : str or matplotlib.colors.Colormap
+        The colormap.
+    norm : matplotlib.colors.Normalize, optional
+        The norm, e.g. the BoundaryNorm of `boundary_cmap`.  If None or not
+        scaled, it is scaled to the range of data.
+    chunk_size : int, optional
+        The approximate number of values processed at a time.
+    n_jobs : int, optional
+        The number of threads processing chunks, one if None.
+
+    Returns
+    -------
+    numpy.ndarray
+        The uint8 RGBA image of shape data.shape + (4,).
+    """
+    cmap = mpl.colormaps[cmap] if isinstance(cmap, str) else cmap
+    lut = colormap_lut(cmap)
+    under, over, bad = cmap.N, cmap.N + 1, cmap.N + 2
+
+    n_rows, n_cols = data.shape[:2]
+    step = max(chunk_size // max(n_cols, 1), 1)
+    chunks = [(i, min(i + step, n_rows)) for i in range(0, n_rows, step)]
+
+    if norm is None:
+        norm = mpl.colors.Normalize()
+    if not norm.scaled():
+        with np.errstate(invalid='ignore'):
+            # float chunks, as an infinite initial does not fit integer data
+            vmin = min(
+                np.nanmin(np.asarray(data[i:j], dtype=float), initial=np.inf)
+                for i, j in chunks
+            )
+            vmax = max(
+                np.nanmax(np.asarray(data[i:j], dtype=float), initial=-np.inf)
+                for i, j in chunks
+            )
+        norm.vmin = vmin if norm.vmin is None else norm.vmin
+        norm.vmax = vmax if norm.vmax is None else norm.vmax
+
+    fast = (
+        type(norm) is mpl.colors.Normalize and not norm.clip and norm.vmin != norm.vmax
+    )
+    out = np.empty((n_rows, n_cols, 4), dtype=np.uint8)
+
+    def colorize_chunk(rows):
+        i, j = rows
+        values = np.asarray(data[i:j])
+        if fast:
+            # linear norm without the masked array overhead
+            x = (values - norm.vmin) / (norm.vmax - norm.vmin)
+            invalid = np.isnan(x)
+        else:
+            x = norm(values)
+            invalid = np.ma.getmaskarray(x) | np.isnan(values)
+            x = np.ma.getdata(x)
+        # as matplotlib.colors.Colormap.__call__, BoundaryNorm gives indices
+        if x.dtype.kind == 'f':
+            x = x * cmap.N
+            x[x == cmap.N] = cmap.N - 1
+        with np.errstate(invalid='ignore'):
+            is_under, is_over = x < 0, x >= cmap.N
+            index = x.astype(np.intp)
+        index[is_under] = under
+        index[is_over] = over
+        index[invalid] = bad
+        out[i:j] = lut.take(index, axis=0)
+
+    if n_jobs is None or n_jobs == 1:
+        for rows in chunks:
+            colorize_chunk(rows)
+    else:
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(n_jobs) as executor:
+            list(executor.map(colorize_chunk, chunks))
+    return out
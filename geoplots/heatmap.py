@@ -1,16 +1,217 @@
 import numpy as np
 import matplotlib as mpl
 import matplotlib.pyplot as plt
+from matplotlib.collections import PathCollection
+from matplotlib.font_manager import FontProperties
+from matplotlib.text import Text
+from geoplots._glyph import glyph_path, glyph_transform
 
 
-def heatmap(df, ax=None, row_labels=None, col_labels=None, **kwargs):
+class AnnotationLayer(PathCollection):
+    """
+    A single collection drawing the annotations of a heatmap.
+
+    Each distinct string is converted into a glyph path once, and all
+    annotations are drawn in one call with per-annotation colors, instead of
+    adding and laying out one `Text` per cell.
+
+    Parameters
+    ----------
+    ax : matplotlib.axes.Axes
+        The axes of the heatmap.
+    x, y : numpy.ndarray
+        Positions of the annotations in data coordinates.
+    texts : numpy.ndarray
+        The annotation strings.
+    colors : numpy.ndarray
+        The color of each annotation.
+    **textkw
+        Font, alignment and rotation arguments of `matplotlib.text.Text`
+        shared by all annotations.
+    """
+
+    def __init__(self, ax, x, y, texts, colors, **textkw):
+        # template of the font, alignment and rotation of the annotations
+        self._text = Text(**textkw)
+        self._glyphs = {}
+        super().__init__(
+            [],
+            offsets=np.column_stack([np.ravel(x), np.ravel(y)]),
+            offset_transform=ax.transData,
+            transform=glyph_transform(ax.figure),
+            edgecolor='none',
+            linewidth=0,
+            zorder=self._text.get_zorder(),
+        )
+        self.set_texts(texts, colors)
+
+    def _glyph(self, s):
+        """
+        Glyph path of a string, aligned on the origin.
+        """
+        if s not in self._glyphs:
+            self._glyphs[s] = glyph_path(
+                s,
+                self._text.get_fontproperties(),
+                self._text.get_horizontalalignment(),
+                self._text.get_verticalalignment(),
+                self._text.get_rotation(),
+            )
+        return self._glyphs[s]
+
+    def set_texts(self, texts, colors, index=None):
+        """
+        Set the strings and colors of the annotations.
+
+        Parameters
+        ----------
+        texts : numpy.ndarray
+            The annotation strings.
+        colors : numpy.ndarray
+            The color of each annotation.
+        index : numpy.ndarray, optional
+            Flat indices of the annotations to set, all of them if None.
+        """
+        texts = np.array(texts, dtype=object).ravel()
+        colors = np.array(colors, dtype=object).ravel()
+        if index is None:
+            self.texts, self.colors = texts, colors
+            self.set_paths([self._glyph(s) for s in texts])
+            self.set_facecolor(list(colors))
+            return
+        self.texts[index], self.colors[index] = texts, colors
+        paths = self.get_paths()
+        for i, s in zip(index, texts):
+            paths[i] = self._glyph(s)
+        facecolors = self.get_facecolor()
+        facecolors[index] = mpl.colors.to_rgba_array(list(colors))
+        self.set_facecolor(facecolors)
+
+
+def cell_size(ax, shape):
+    """
+    Size of the cells of a heatmap in pixels.
+
+    Parameters
+    ----------
+    ax
+        The `matplotlib.axes.Axes` of the heatmap.
+    shape
+        The (rows, columns) of the heatmap.
+
+    Returns
+    -------
+    tuple
+        (width, height) of a cell in pixels.
+    """
+    # imshow keeps the aspect of the data, so the drawn box can be smaller
+    ax.apply_aspect()
+    bbox = ax.get_window_extent()
+    return bbox.width / shape[1], bbox.height / shape[0]
+
+
+def text_size(fontsize, nchars, dpi):
+    """
+    Approximate size of a single-line text in pixels.
+
+    Parameters
+    ----------
+    fontsize
+        The font size in points, or a relative size like 'small'.
+    nchars
+        The number of characters.
+    dpi
+        The resolution of the figure.
+
+    Returns
+    -------
+    tuple
+        (width, height) of the text in pixels.
+    """
+    size = FontProperties(size=fontsize).get_size_in_points() * dpi / 72
+    # an average character is about 0.6 em wide, a line is 1.2 em high
+    return 0.6 * size * nchars, 1.2 * size
+
+
+def downsample(data, shape, how='mean', chunk_size=2**24):
+    """
+    Downsample a large 2D array chunk by chunk with block aggregation.
+
+    Each output cell aggregates a block of about data.shape / shape cells,
+    ignoring NaN.  Only a chunk of rows is read into memory at a time, so data
+    can be a `numpy.memmap`, a zarr or h5py array, or any array-like with a
+    shape that returns arrays when sliced by rows.
+
+    Parameters
+    ----------
+    data
+        The 2D array-like to downsample.
+    shape
+        The (rows, columns) of the output, no larger than data.
+    how
+        The aggregation of each block: 'mean', 'max' or 'min'.  Optional.
+    chunk_size
+        The approximate number of values read at a time.  Optional.
+
+    Returns
+    -------
+    numpy.ndarray
+        The downsampled float array.
+    """
+    reducers = {'mean': np.add, 'max': np.fmax, 'min': np.fmin}
+    if how not in reducers:
+        raise ValueError("how should be one of 'mean', 'max', 'min'")
+    reducer = reducers[how]
+
+    n_rows, n_cols = data.shape[:2]
+    if not (0 < shape[0] <= n_rows and 0 < shape[1] <= n_cols):
+        raise ValueError(
+            'shape {} should be positive and no larger than the data {}'.format(
+                tuple(shape), (n_rows, n_cols)
+            )
+        )
+    row_edges = np.linspace(0, n_rows, shape[0] + 1).astype(int)
+    col_starts = np.linspace(0, n_cols, shape[1] + 1).astype(int)[:-1]
+    # output rows read together, at least one
+    step = max(chunk_size // max(n_cols * (n_rows // shape[0]), 1), 1)
+
+    out = np.empty(shape, dtype=float)
+    for i in range(0, shape[0], step):
+        edges = row_edges[i : i + step + 1]
+        chunk = np.asarray(data[edges[0] : edges[-1]], dtype=float)
+        starts = edges[:-1] - edges[0]
+        if how == 'mean':
+            valid = ~np.isnan(chunk)
+            total = np.add.reduceat(np.where(valid, chunk, 0), starts, axis=0)
+            count = np.add.reduceat(valid, starts, axis=0)
+            total = np.add.reduceat(total, col_starts, axis=1)
+            count = np.add.reduceat(count, col_starts, axis=1)
+            with np.errstate(invalid='ignore'):
+                out[i : i + len(starts)] = total / count
+        else:
+            block = reducer.reduceat(chunk, starts, axis=0)
+            out[i : i + len(starts)] = reducer.reduceat(block, col_starts, axis=1)
+    return out
+
+
+def heatmap(
+    df,
+    ax=None,
+    row_labels=None,
+    col_labels=None,
+    thin=False,
+    resolution=None,
+    how='mean',
+    **kwargs,
+):
     """
     Create a heatmap from a numpy array and two lists of labels.
 
     Parameters
     ----------
     df
-        A pandas DataFrame where values are plotted.
+        A pandas DataFrame where values are plotted, or a 2D array-like such
+        as a `numpy.memmap` or a zarr array, labeled by row and column numbers.
     ax
         A `matplotlib.axes.Axes` instance to which the heatmap is plotted.  If
         not provided, use current axes or create a new one.  Optional.
@@ -18,6 +219,17 @@ def heatmap(df, ax=None, row_labels=None, col_labels=None, **kwargs):
         A list or array of length M with the labels for the rows.
     col_labels
         A list or array of length N with the labels for the columns.
+    thin
+        If True, show only as many tick labels as fit in the axes without
+        overlapping, and skip the white grid if the cells are too small for
+        it.  The axes should have its final size.  Optional.
+    resolution
+        The (rows, columns) the data is downsampled to with `downsample`
+        before plotting, and tick labels are thinned.  If 'auto', data larger
+        than the axes is downsampled to its size in pixels.  If None (the
+        default), data is plotted as is.  Optional.
+    how
+        The aggregation used to downsample: 'mean', 'max' or 'min'.  Optional.
     **kwargs
         All other arguments are forwarded to `imshow`.
     """
@@ -25,29 +237,69 @@ def heatmap(df, ax=None, row_labels=None, col_labels=None, **kwargs):
     if ax is None:
         ax = plt.gca()
 
+    # pandas DataFrame or array-like
+    if hasattr(df, 'index') and hasattr(df, 'columns'):
+        index, columns, values = df.index, df.columns, df.values
+    else:
+        index, columns, values = range(df.shape[0]), range(df.shape[1]), df
+
     if row_labels is None:
-        row_labels = list(df.index)
+        row_labels = list(index)
     elif isinstance(row_labels, dict):
-        row_labels = [row_labels[i] for i in df.index]
+        row_labels = [row_labels[i] for i in index]
 
     if col_labels is None:
-        col_labels = list(df.columns)
+        col_labels = list(columns)
     elif isinstance(col_labels, dict):
-        col_labels = [col_labels[i] for i in df.columns]
+        col_labels = [col_labels[i] for i in columns]
 
-    # Plot the heatmap
-    im = ax.imshow(df.values, **kwargs)
+    if isinstance(resolution, str) and resolution == 'auto':
+        bbox = ax.get_window_extent()
+        resolution = (
+            min(df.shape[0], max(int(bbox.height), 1)),
+            min(df.shape[1], max(int(bbox.width), 1)),
+        )
+        if tuple(resolution) == tuple(df.shape[:2]):
+            resolution = None
 
-    # Show all ticks and label them with the respective list entries.
+    # Plot the heatmap, in row and column numbers of df if downsampled
+    if resolution is not None:
+        thin = True
+        bottom, top = df.shape[0] - 0.5, -0.5
+        if kwargs.get('origin', mpl.rcParams['image.origin']) == 'lower':
+            bottom, top = top, bottom
+        kwargs.setdefault('extent', (-0.5, df.shape[1] - 0.5, bottom, top))
+        values = downsample(values, resolution, how=how)
+    im = ax.imshow(values, **kwargs)
+    # update_heatmap downsamples new data the same way
+    im._downsample_how = how
+
+    # Show every step-th tick, all of them unless thin is set
+    xstep, ystep, grid = 1, 1, True
+    if thin:
+        dpi = ax.figure.dpi
+        cell_width, cell_height = cell_size(ax, df.shape)
+        label_width, _ = text_size(
+            mpl.rcParams['xtick.labelsize'],
+            max((len(str(i)) for i in col_labels), default=0) + 1,
+            dpi,
+        )
+        _, label_height = text_size(mpl.rcParams['ytick.labelsize'], 1, dpi)
+        xstep = max(int(np.ceil(label_width / cell_width)), 1)
+        ystep = max(int(np.ceil(label_height / cell_height)), 1)
+        # the 3 pt white grid would hide cells narrower than a few lines
+        grid = min(cell_width, cell_height) > 4 * 3 * dpi / 72
+
+    # Show ticks and label them with the respective list entries.
     ax.set_xticks(
-        np.arange(df.shape[1]),
-        labels=col_labels,
+        np.arange(0, df.shape[1], xstep),
+        labels=list(col_labels)[::xstep],
         fontweight='bold',
         fontname='consolas',
     )
     ax.set_yticks(
-        np.arange(df.shape[0]),
-        labels=row_labels,
+        np.arange(0, df.shape[0], ystep),
+        labels=list(row_labels)[::ystep],
         fontweight='bold',
         fontname='consolas',
     )
@@ -61,17 +313,222 @@ def heatmap(df, ax=None, row_labels=None, col_labels=None, **kwargs):
     # Turn spines off and create white grid.
     ax.spines[:].set_visible(False)
 
-    ax.set_xticks(np.arange(df.shape[1] + 1) - 0.5, minor=True)
-    ax.set_yticks(np.arange(df.shape[0] + 1) - 0.5, minor=True)
-    ax.grid(which='minor', color='w', linestyle='-', linewidth=3)
+    if grid:
+        ax.set_xticks(np.arange(df.shape[1] + 1) - 0.5, minor=True)
+        ax.set_yticks(np.arange(df.shape[0] + 1) - 0.5, minor=True)
+        ax.grid(which='minor', color='w', linestyle='-', linewidth=3)
     ax.tick_params(which='minor', bottom=False, left=False)
     ax.tick_params(length=0)
 
     return im
 
 
+def clustered_heatmap(
+    df,
+    ax=None,
+    row_labels=None,
+    col_labels=None,
+    method='average',
+    metric='euclidean',
+    optimal_ordering=False,
+    row_linkage=None,
+    col_linkage=None,
+    cluster_rows=True,
+    cluster_cols=True,
+    dendrogram=False,
+    dendrogram_ratio=0.15,
+    **kwargs,
+):
+    """
+    Create a heatmap with rows and columns reordered by hierarchical clustering.
+
+    Requires scipy.  Distances are computed as condensed matrices by
+    `scipy.cluster.hierarchy.linkage`, and the returned linkages can be passed
+    back to redraw the same ordering without clustering again, e.g. with other
+    colors.
+
+    Parameters
+    ----------
+    df
+        A pandas DataFrame or 2D array where values are plotted.
+    ax
+        A `matplotlib.axes.Axes` instance to which the heatmap is plotted.  If
+        dendrogram is True, its grid cell is split into the heatmap and the
+        dendrogram axes.  If not provided, use current axes.  Optional.
+    row_labels, col_labels
+        The labels of rows and columns in the order of df, as in `heatmap`.
+        Arrays are labeled by their row and column numbers.  Optional.
+    method, metric
+        The linkage method and distance metric of
+        `scipy.cluster.hierarchy.linkage`.  Optional.
+    optimal_ordering
+        If True, reorder the leaves so that the distance between successive
+        leaves is minimal.  Slower on large data.  Optional.
+    row_linkage, col_linkage
+        Linkage matrices returned by a previous call, used instead of
+        clustering the rows or columns again.  Optional.
+    cluster_rows, cluster_cols
+        Whether to reorder the rows and columns.  Optional.
+    dendrogram
+        If True, draw the row dendrogram on the right and the column dendrogram
+        below the heatmap.  Optional.
+    dendrogram_ratio
+        The fraction of the grid cell used by each dendrogram.  Optional.
+    **kwargs
+        All other arguments are forwarded to `heatmap`.
+
+    Returns
+    -------
+    tuple
+        (im, row_linkage, col_linkage), the AxesImage and the linkage matrices
+        of rows and columns, None for those not clustered.
+    """
+    from scipy.cluster import hierarchy
+
+    if ax is None:
+        ax = plt.gca()
+
+    values = np.asarray(df.values if hasattr(df, 'iloc') else df, dtype=float)
+    if cluster_rows and row_linkage is None:
+        row_linkage = hierarchy.linkage(
+            values, method=method, metric=metric, optimal_ordering=optimal_ordering
+        )
+    if cluster_cols and col_linkage is None:
+        col_linkage = hierarchy.linkage(
+            values.T, method=method, metric=metric, optimal_ordering=optimal_ordering
+        )
+    rows = (
+        hierarchy.leaves_list(row_linkage)
+        if cluster_rows
+        else np.arange(values.shape[0])
+    )
+    cols = (
+        hierarchy.leaves_list(col_linkage)
+        if cluster_cols
+        else np.arange(values.shape[1])
+    )
+
+    # Reorder data and labels, dict labels are looked up by heatmap
+    if hasattr(df, 'iloc'):
+        ordered = df.iloc[rows, cols]
+    else:
+        ordered = values[np.ix_(rows, cols)]
+        if row_labels is None:
+            row_labels = list(range(values.shape[0]))
+        if col_labels is None:
+            col_labels = list(range(values.shape[1]))
+    if row_labels is not None and not isinstance(row_labels, dict):
+        row_labels = [row_labels[i] for i in rows]
+    if col_labels is not None and not isinstance(col_labels, dict):
+        col_labels = [col_labels[i] for i in cols]
+
+    if dendrogram:
+        grids = ax.get_subplotspec().subgridspec(
+            2,
+            2,
+            width_ratios=[1 - dendrogram_ratio, dendrogram_ratio],
+            height_ratios=[1 - dendrogram_ratio, dendrogram_ratio],
+            wspace=0,
+            hspace=0,
+        )
+        fig = ax.figure
+        ax.remove()
+        ax = fig.add_subplot(grids[0, 0])
+        # dendrogram leaves must line up with the cells
+        kwargs.setdefault('aspect', 'auto')
+        for linkage, grid, orientation in [
+            (row_linkage if cluster_rows else None, grids[0, 1], 'right'),
+            (col_linkage if cluster_cols else None, grids[1, 0], 'bottom'),
+        ]:
+            if linkage is None:
+                continue
+            dax = fig.add_subplot(grid)
+            hierarchy.dendrogram(
+                linkage,
+                ax=dax,
+                orientation=orientation,
+                no_labels=True,
+                link_color_func=lambda k: 'k',
+            )
+            # leaves are drawn at 5, 15, 25, ... from the bottom or the left
+            if orientation == 'right':
+                dax.set_ylim(10 * len(rows), 0)
+            else:
+                dax.set_xlim(0, 10 * len(cols))
+            dax.axis('off')
+
+    im = heatmap(ordered, ax=ax, row_labels=row_labels, col_labels=col_labels, **kwargs)
+    return im, row_linkage, col_linkage
+
+
+def cell_centers(im, shape):
+    """
+    Centers of the cells of a heatmap in data coordinates.
+
+    Parameters
+    ----------
+    im
+        The AxesImage of the heatmap.
+    shape
+        The (rows, columns) of the annotated data, which may differ from the
+        image when it is downsampled.
+
+    Returns
+    -------
+    tuple
+        (x, y) arrays of the given shape.
+    """
+    left, right, bottom, top = im.get_extent()
+    if im.origin == 'upper':
+        bottom, top = top, bottom
+    x = left + (np.arange(shape[1]) + 0.5) * (right - left) / shape[1]
+    y = bottom + (np.arange(shape[0]) + 0.5) * (top - bottom) / shape[0]
+    return np.meshgrid(x, y)
+
+
+def annotation_texts(data, valfmt='{x:.2f}', textcolors='black', bounds=None):
+    """
+    Format the annotations of a heatmap and pick their colors at once.
+
+    Parameters
+    ----------
+    data
+        The values to annotate.
+    valfmt, textcolors, bounds
+        As in `annotate_heatmap`.  Optional.
+
+    Returns
+    -------
+    tuple
+        (texts, colors), object arrays of the annotation strings and colors.
+    """
+    data = np.asarray(data)
+    if bounds is None:
+        bounds = [-np.inf, np.inf]
+    norm = mpl.colors.BoundaryNorm(bounds, len(bounds) - 1)
+
+    if isinstance(textcolors, str):
+        textcolors = [textcolors for i in range(len(bounds) - 1)]
+    if isinstance(valfmt, str):
+        valfmt = mpl.ticker.StrMethodFormatter(valfmt)
+
+    texts = np.frompyfunc(lambda x: valfmt(x, None), 1, 1)(data)
+    # a 1D lookup table, as tuple colors would make a 2D object array
+    lut = np.empty(len(textcolors), dtype=object)
+    lut[:] = list(textcolors)
+    colors = lut[np.asarray(norm(data))]
+    return texts, colors
+
+
 def annotate_heatmap(
-    im, data=None, valfmt='{x:.2f}', textcolors='black', bounds=None, **textkw
+    im,
+    data=None,
+    valfmt='{x:.2f}',
+    textcolors='black',
+    bounds=None,
+    batch=False,
+    thin=False,
+    **textkw,
 ):
     """
     A function to annotate a heatmap.
@@ -93,9 +550,21 @@ def annotate_heatmap(
         Value in data units according to which the colors from textcolors are
         applied.  If None (the default) uses the middle of the colormap as
         separation.  Optional.
+    batch
+        If True, format all values and pick all colors at once, and draw the
+        annotations with a single `AnnotationLayer` instead of one `Text` per
+        cell.  Much faster for large heatmaps.  Optional.
+    thin
+        If True, skip the annotations when they do not fit in the cells at
+        their font size, and return an empty list.  Optional.
     **kwargs
         All other arguments are forwarded to each call to `text` used to create
         the text labels.
+
+    Returns
+    -------
+    list or AnnotationLayer
+        The text labels, or the annotation layer if batch is True.
     """
 
     if not isinstance(data, (list, np.ndarray)):
@@ -118,13 +587,115 @@ def annotate_heatmap(
     if isinstance(valfmt, str):
         valfmt = mpl.ticker.StrMethodFormatter(valfmt)
 
+    if batch or thin:
+        texts, colors = annotation_texts(data, valfmt, textcolors, bounds)
+
+    if thin:
+        width, height = text_size(
+            Text(**kw).get_fontsize(),
+            max((len(s) for s in texts.flat), default=0),
+            im.axes.figure.dpi,
+        )
+        cell_width, cell_height = cell_size(im.axes, np.shape(data))
+        if width > cell_width or height > cell_height:
+            return []
+
+    # cells of a downsampled heatmap span several rows and columns of df
+    x, y = cell_centers(im, np.shape(data)[:2])
+    if batch:
+        layer = AnnotationLayer(im.axes, x, y, texts, colors, **kw)
+        im.axes.add_collection(layer, autolim=False)
+        return layer
+
     # Loop over the data and create a `Text` for each "pixel".
     # Change the text's color depending on the data.
     texts = []
     for i in range(data.shape[0]):
         for j in range(data.shape[1]):
             kw.update(color=textcolors[norm(data[i, j])])
-            text = im.axes.text(j, i, valfmt(data[i, j], None), **kw)
+            text = im.axes.text(x[i, j], y[i, j], valfmt(data[i, j], None), **kw)
             texts.append(text)
 
     return texts
+
+
+def update_heatmap(
+    im,
+    data,
+    annotations=None,
+    valfmt='{x:.2f}',
+    textcolors='black',
+    bounds=None,
+    how=None,
+):
+    """
+    Update the values of a heatmap and its annotations in place.
+
+    Ticks, labels and artists are kept, and only the annotations whose string
+    or color changed are rewritten.
+
+    Parameters
+    ----------
+    im
+        The AxesImage returned by `heatmap`.
+    data
+        The new values, a pandas DataFrame or 2D array-like of the same shape
+        as the heatmap.  Data of a downsampled heatmap is downsampled again.
+    annotations
+        The list or `AnnotationLayer` returned by `annotate_heatmap`.
+        Optional.
+    valfmt, textcolors, bounds
+        The arguments given to `annotate_heatmap`.  Optional.
+    how
+        The aggregation used to downsample data.  If None (the default), that
+        given to `heatmap`.  Optional.
+
+    Returns
+    -------
+    list
+        The artists that changed.
+    """
+    values = data.values if hasattr(data, 'iloc') else data
+    shape = im.get_array().shape[:2]
+    if np.shape(values)[:2] != shape:
+        if np.shape(values)[0] < shape[0] or np.shape(values)[1] < shape[1]:
+            raise ValueError(
+                'data of shape {} is smaller than the heatmap {}'.format(
+                    np.shape(values)[:2], shape
+                )
+            )
+        if how is None:
+            how = getattr(im, '_downsample_how', 'mean')
+        values = downsample(values, shape, how=how)
+    values = np.asarray(values)
+    im.set_data(values)
+    changed = [im]
+
+    # annotate_heatmap returns [] when annotations are skipped
+    if annotations is None or isinstance(annotations, list) and not annotations:
+        return changed
+
+    texts, colors = annotation_texts(values, valfmt, textcolors, bounds)
+    texts, colors = texts.ravel(), colors.ravel()
+    if isinstance(annotations, AnnotationLayer):
+        recolored = annotations.colors != colors
+        if recolored.any():
+            # the same color given in another form is not a change
+            index = np.flatnonzero(recolored)
+            recolored[index] = np.any(
+                mpl.colors.to_rgba_array(list(annotations.colors[index]))
+                != mpl.colors.to_rgba_array(list(colors[index])),
+                axis=1,
+            )
+        index = np.flatnonzero((annotations.texts != texts) | recolored)
+        if index.size:
+            annotations.set_texts(texts[index], colors[index], index=index)
+            changed.append(annotations)
+        return changed
+
+    for text, s, color in zip(annotations, texts, colors):
+        if text.get_text() != s or not mpl.colors.same_color(text.get_color(), color):
+            text.set_text(s)
+            text.set_color(color)
+            changed.append(text)
+    return changed
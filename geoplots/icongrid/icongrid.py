@@ -1,15 +1,19 @@
 #!/usr/bin/python
 # -*-coding: utf-8 -*-
 import numpy as np
+from matplotlib import cbook
 from matplotlib.pyplot import cm
 from matplotlib.figure import Figure
+from matplotlib.animation import FuncAnimation
 from matplotlib.patches import Rectangle, Patch
+from matplotlib.collections import PolyCollection, PathCollection
 import matplotlib.font_manager as fm
 from matplotlib.text import Text
 from matplotlib.legend_handler import HandlerBase
-import copy
 import os
-from itertools import product
+from collections import ChainMap
+from functools import lru_cache
+from geoplots._glyph import glyph_path, glyph_transform
 
 
 def ceil(a, b):
@@ -54,6 +58,82 @@ def array_resize(array, length, array_len=None):
     return array * (length // array_len) + array[: length % array_len]
 
 
+def visible_mask(values, nan=None):
+    """
+    Mask of the values to be plotted as blocks.
+
+    Parameters
+    ----------
+    values : numpy.ndarray
+        The values of the waffle chart.
+    nan : object, optional
+        The value of hidden blocks. It can be a sentinel value or float NaN,
+        which matches every NaN in values.
+
+    Returns
+    -------
+    numpy.ndarray
+        Boolean array of the same shape as values, True for visible blocks.
+    """
+    values = np.asarray(values)
+    if nan is None:
+        return np.ones(values.shape, dtype=bool)
+    if isinstance(nan, float) and np.isnan(nan):
+        if values.dtype.kind in 'fc':
+            return ~np.isnan(values)
+        if values.dtype.kind in 'mM':
+            return ~np.isnat(values)
+        if values.dtype.kind != 'O':
+            # integer, bool or string values cannot hold NaN
+            return np.ones(values.shape, dtype=bool)
+        # NaN is the only value not equal to itself
+        return np.fromiter((v == v for v in values.flat), bool, values.size).reshape(
+            values.shape
+        )
+    return values != nan
+
+
+def has_key(mapping, key):
+    """
+    Whether a per-category argument, a dict or a sequence, has key.
+    """
+    if isinstance(mapping, dict):
+        return key in mapping
+    try:
+        mapping[key]
+    except (IndexError, KeyError, TypeError):
+        return False
+    return True
+
+
+def collection_args(rectangle_args):
+    """
+    Translate Rectangle arguments into PolyCollection arguments.
+
+    Parameters
+    ----------
+    rectangle_args : dict
+        The arguments of `matplotlib.patches.Rectangle` of one category.
+
+    Returns
+    -------
+    dict or None
+        The arguments of `matplotlib.collections.PolyCollection`, or None if
+        some argument, e.g. angle, has no collection equivalent.
+    """
+    args = dict(rectangle_args)
+    fill = args.pop('fill', True)
+    args = cbook.normalize_kwargs(args, PolyCollection)
+    if not all(hasattr(PolyCollection, 'set_' + k) for k in args):
+        return None
+    if not fill:
+        # an unfilled patch draws color on its edges only
+        if 'color' in args:
+            args.setdefault('edgecolor', args.pop('color'))
+        args['facecolor'] = 'none'
+    return args
+
+
 _FONT_PATH = os.path.dirname(__file__)
 FONT_FOLDER = {
     'brands': os.path.join(_FONT_PATH, 'icons', 'fa-brands-400.ttf'),
@@ -62,6 +142,58 @@ FONT_FOLDER = {
 }
 
 
+@lru_cache(maxsize=64)
+def font_properties(fname=None, family=None, size=None):
+    """
+    Shared font properties of the icon and number fonts.
+
+    Font properties are cached by (fname, family, size) with LRU eviction, so
+    the font file is resolved once. Text copies the font properties it gets,
+    but callers should not modify the returned object.
+
+    Parameters
+    ----------
+    fname : str, optional
+        Path of the font file, e.g. a value of FONT_FOLDER.
+    family : str, optional
+        The font family, used if fname is not given.
+    size : float, optional
+        The font size in points.
+
+    Returns
+    -------
+    matplotlib.font_manager.FontProperties
+        The cached font properties.
+    """
+    return fm.FontProperties(fname=fname, family=family, size=size)
+
+
+@lru_cache(maxsize=256)
+def icon_path(icon, font_file, size, rotation=None):
+    """
+    Convert an icon character into a glyph path centered on the origin.
+
+    Parameters
+    ----------
+    icon : str
+        The icon character.
+    font_file : str
+        Path of the font file containing the icon.
+    size : float
+        The font size in points.
+    rotation : float, optional
+        The rotation in degrees around the center.
+
+    Returns
+    -------
+    matplotlib.path.Path
+        The glyph outline in points, centered on (0, 0).
+    """
+    return glyph_path(
+        icon, font_properties(fname=font_file, size=size), rotation=rotation
+    )
+
+
 class TextLegend(object):
     """
     A legend handle for text icons.
@@ -105,7 +237,7 @@ class TextLegendHandler(HandlerBase):
             'horizontalalignment': 'center',
             'verticalalignment': 'center',
             'color': orig_handle.color,
-            'fontproperties': fm.FontProperties(fname=self.font_file, size=fontsize),
+            'fontproperties': font_properties(fname=self.font_file, size=fontsize),
         }
         kwargs.update(orig_handle.kwargs)
         annotation = Text(x, y, orig_handle.text, **kwargs)
@@ -118,7 +250,7 @@ class TextLegendHandler(HandlerBase):
             'horizontalalignment': 'center',
             'verticalalignment': 'center',
             'color': orig_handle.color,
-            'fontproperties': fm.FontProperties(fname=self.font_file, size=fontsize),
+            'fontproperties': font_properties(fname=self.font_file, size=fontsize),
         }
         kwargs.update(orig_handle.kwargs)
         patch = Text(
@@ -211,6 +343,12 @@ class Waffle(Figure):
     For 'NE', plots start at upper right and end at lower left.
     For 'SE', plots start at lower right and end at upper left.
     :type plot_direction: str
+
+    :param collection: Whether to draw the blocks of each category as a single collection
+        instead of one artist per block. Rectangles become a PolyCollection and icons a
+        PathCollection stamping one glyph path. Blocks look the same, but large grids are
+        built and saved much faster. [Default True]
+    :type collection: bool
     """
 
     _direction_values = {
@@ -259,6 +397,7 @@ class Waffle(Figure):
             'nan': kwargs.pop('nan', None),
             'x_offset': kwargs.pop('x_offset', 0),
             'y_offset': kwargs.pop('y_offset', 0),
+            'collection': kwargs.pop('collection', True),
         }
         self.plots = kwargs.pop('plots', None)
         self.cover_plots = kwargs.pop('cover_plots', None)
@@ -269,38 +408,77 @@ class Waffle(Figure):
 
         Figure.__init__(self, *args, **kwargs)
 
+        # Blocks drawn with collections of each subplot, used by update
+        self._layers = {}
+
         if self.plots is not None:
             for loc, setting in self.plots.items():
-                self._waffle(loc, **copy.deepcopy(setting))
+                self._waffle(loc, **setting)
         if self.cover_plots is not None:
             for loc, setting in self.cover_plots:
-                self._waffle(loc, **copy.deepcopy(setting))
+                self._waffle(loc, **setting)
 
         # Adjust the layout
         # self.set_tight_layout(True)
 
     def _waffle(self, loc, **kwargs):
-        # _pa is the arguments for this single plot
-        self._pa = kwargs
-
-        # Append figure args to plot args
-        plot_fig_args = copy.deepcopy(self.fig_args)
-        for arg, v in plot_fig_args.items():
-            if arg not in self._pa:
-                self._pa[arg] = v
-
-        element = np.delete(
-            np.unique(self._pa['values']),
-            np.where(np.unique(self._pa['values']) == self._pa['nan'])[0],
+        # _pa is the arguments for this single plot, layered over figure args.
+        # Resolved arguments are written to the empty top layer, so neither the
+        # subplot settings nor fig_args (and the values arrays they hold) are
+        # copied or modified.
+        self._pa = ChainMap({}, kwargs, self.fig_args)
+        # legend is filled with handles below
+        self._pa['legend'] = dict(self._pa['legend'])
+
+        plot_direction = self._pa['plot_direction'].upper()
+
+        try:
+            column_order = self._direction_values[plot_direction]['column_order']
+            row_order = self._direction_values[plot_direction]['row_order']
+        except KeyError:
+            raise KeyError("plot_direction should be one of 'NW', 'SW', 'NE', 'SE'")
+
+        # Hidden blocks are dropped before any geometry is built, and cell_codes
+        # is the index of each visible block's category in element
+        visible = visible_mask(self._pa['values'], self._pa['nan'])
+        cols, rows = self._cell_grid(visible, column_order, row_order)
+        element, cell_codes = np.unique(
+            np.asarray(self._pa['values'])[visible.shape[0] - 1 - rows, cols],
+            return_inverse=True,
         )
+        cell_codes = cell_codes.ravel()
         self.values_len = element.shape[0]
 
+        # Categories of a colors dict absent from the values get empty
+        # collections, so that update can show them, if they have all their
+        # per-category arguments. Legends and labels keep to element.
+        categories = element
+        if self._pa['collection'] and isinstance(self._pa['colors'], dict):
+            mappings = [
+                v for v in self._pa['rectangle_args'].values() if isinstance(v, dict)
+            ] + [
+                self._pa[key]
+                for key in ('icons', 'rotation', 'marker')
+                if self._pa[key] and not isinstance(self._pa[key], str)
+            ]
+            present = set(element.tolist())
+            extra = [
+                k
+                for k in self._pa['colors']
+                if k not in present
+                and visible_mask([k], self._pa['nan'])[0]
+                and all(has_key(m, k) for m in mappings)
+            ]
+            if extra:
+                categories = np.union1d(element, extra)
+                cell_codes = np.searchsorted(categories, element)[cell_codes]
+
         # Build a color sequence if colors is empty
         if self._pa['colors'] is not None:
             if isinstance(self._pa['colors'], dict):
-                self._pa['colors'] = {i: self._pa['colors'][i] for i in element}
+                self._pa['colors'] = {i: self._pa['colors'][i] for i in categories}
             else:
-                self._pa['colors'] = {i: self._pa['colors'] for i in element}
+                self._pa['colors'] = {i: self._pa['colors'] for i in categories}
         else:
             default_colors = cm.get_cmap(self._pa['cmap_name']).colors
             default_color_num = cm.get_cmap(self._pa['cmap_name']).N
@@ -319,10 +497,12 @@ class Waffle(Figure):
         for k, v in self._pa['rectangle_args'].items():
             if isinstance(v, dict):
                 rectangle_args[k] = {
-                    i: self._pa['rectangle_args'][k][i] for i in element
+                    i: self._pa['rectangle_args'][k][i] for i in categories
                 }
             else:
-                rectangle_args[k] = {i: self._pa['rectangle_args'][k] for i in element}
+                rectangle_args[k] = {
+                    i: self._pa['rectangle_args'][k] for i in categories
+                }
         if not any(
             i in rectangle_args.keys()
             for i in ['color', 'edgecolor', 'facecolor', 'ec', 'fc']
@@ -348,17 +528,34 @@ class Waffle(Figure):
             # If icons is a string, convert it into a list of same icon. It's length is the label's length
             # '\uf26e' -> ['\uf26e', '\uf26e', '\uf26e', ]
             if isinstance(self._pa['icons'], str):
-                self._pa['icons'] = {i: self._pa['icons'] for i in element}
+                self._pa['icons'] = {i: self._pa['icons'] for i in categories}
 
             if len(self._pa['icons']) < self.values_len:
                 raise ValueError("Length of icons doesn't match the values.")
 
             self._pa['icons'] = {
-                i: icons[self._pa['icon_set']][self._pa['icons'][i]] for i in element
+                i: icons[self._pa['icon_set']][self._pa['icons'][i]] for i in categories
             }
 
         if self._pa['rotation']:
-            self._pa['rotation'] = {i: self._pa['rotation'][i] for i in element}
+            self._pa['rotation'] = {i: self._pa['rotation'][i] for i in categories}
+
+        # Per-category lookup tables, indexed by codes
+        color_table = [self._pa['colors'][i] for i in categories]
+        icon_table = (
+            [self._pa['icons'][i] for i in categories] if self._pa['icons'] else None
+        )
+        rotation_table = (
+            [self._pa['rotation'][i] for i in categories]
+            if self._pa['rotation']
+            else None
+        )
+        marker_table = (
+            [self._pa['marker'][i] for i in categories] if self._pa['marker'] else None
+        )
+        rectangle_table = [
+            {k: v[i] for k, v in rectangle_args.items()} for i in categories
+        ]
 
         if isinstance(loc, tuple):
             self.ax = self.add_subplot(*loc, aspect='equal')
@@ -396,13 +593,13 @@ class Waffle(Figure):
         # Default font size
         if self._pa['icons']:
             x, y = self.ax.transData.transform([(0, 0), (0, block_x_length)])
-            prop = fm.FontProperties(
+            prop = font_properties(
                 fname=FONT_FOLDER[self._pa['icon_set']],
                 size=self._pa['icon_size'] or int((y[1] - x[1]) / 16 * 12),
             )
         elif self._pa['show_num']:
             x, y = self.ax.transData.transform([(0, 0), (0, block_x_length)])
-            prop = fm.FontProperties(
+            prop = font_properties(
                 family='consolas',
                 size=self._pa['icon_size'] or int((y[1] - x[1]) / 16 * 12),
             )
@@ -411,95 +608,118 @@ class Waffle(Figure):
         x_full = (1 + self._pa['interval_ratio_x']) * block_x_length
         y_full = (1 + self._pa['interval_ratio_y']) * block_y_length
 
-        plot_direction = self._pa['plot_direction'].upper()
-
-        try:
-            column_order = self._direction_values[plot_direction]['column_order']
-            row_order = self._direction_values[plot_direction]['row_order']
-        except KeyError:
-            raise KeyError("plot_direction should be one of 'NW', 'SW', 'NE', 'SE'")
+        # Geometry and collections of the blocks, kept for update
+        codes = np.full(visible.shape, -1)
+        codes[visible.shape[0] - 1 - rows, cols] = cell_codes
+        layer = {
+            'ax': self.ax,
+            'element': categories,
+            'nan': self._pa['nan'],
+            'codes': codes,
+            'column_order': column_order,
+            'row_order': row_order,
+            'x_full': x_full,
+            'y_full': y_full,
+            'block_x_length': block_x_length,
+            'block_y_length': block_y_length,
+            'x_offset': self._pa['x_offset'],
+            'y_offset': self._pa['y_offset'],
+        }
 
-        iter_cell = (
-            (col, row)
-            for col, row in product(
-                range(self._pa['columns'])[::column_order],
-                range(self._pa['rows'])[::row_order],
+        # Rectangle arguments without a collection equivalent fall back to
+        # drawing a Rectangle per block
+        collection_table = [collection_args(args) for args in rectangle_table]
+        if self._pa['collection'] and (
+            self._pa['icons']
+            or not (
+                self._pa['show_num'] or self._pa['marker'] or None in collection_table
             )
-            if self._pa['values'][self._pa['rows'] - 1 - row, col] != self._pa['nan']
-        )
-        for col, row in iter_cell:
-            x = x_full * col
-            y = y_full * row
-
+        ):
+            groups = self._group_cells(cell_codes, len(categories))
             if self._pa['icons']:
-                rotation_arg = None
-                if self._pa['rotation']:
-                    rotation_arg = self._pa['rotation'][
-                        self._pa['values'][self._pa['rows'] - 1 - row, col]
-                    ]
-                self.ax.text(
-                    x=x + block_x_length * (1 / 2 + self._pa['x_offset']),
-                    y=y + block_y_length * (1 / 2 + self._pa['y_offset']),
-                    s=self._pa['icons'][
-                        self._pa['values'][self._pa['rows'] - 1 - row, col]
-                    ],
-                    color=self._pa['colors'][
-                        self._pa['values'][self._pa['rows'] - 1 - row, col]
-                    ],
-                    fontproperties=prop,
-                    horizontalalignment='center',
-                    verticalalignment='center',
-                    rotation=rotation_arg,
-                )
-            elif self._pa['show_num']:
-                self.ax.text(
-                    x=x + block_x_length * (1 / 2 + self._pa['x_offset']),
-                    y=y + block_y_length * (1 / 2 + self._pa['y_offset']),
-                    s=str(self._pa['values'][self._pa['rows'] - 1 - row, col]),
-                    color=self._pa['colors'][
-                        self._pa['values'][self._pa['rows'] - 1 - row, col]
-                    ],
-                    fontproperties=prop,
-                    horizontalalignment='center',
-                    verticalalignment='center',
-                )
-            elif self._pa['marker']:
-                self.ax.plot(
-                    x + block_x_length * (1 / 2 + self._pa['x_offset']),
-                    y + block_y_length * (1 / 2 + self._pa['y_offset']),
-                    color=self._pa['colors'][
-                        self._pa['values'][self._pa['rows'] - 1 - row, col]
-                    ],
-                    marker=self._pa['marker'][
-                        self._pa['values'][self._pa['rows'] - 1 - row, col]
-                    ],
-                    **self._pa['marker_args'],
-                )
+                layer['kind'] = 'icons'
+                transform = glyph_transform(self)
+                layer['collections'] = [
+                    self._draw_icons(
+                        layer,
+                        cols[cells],
+                        rows[cells],
+                        icon_table[code],
+                        prop,
+                        rotation_table[code] if rotation_table else None,
+                        color_table[code],
+                        transform,
+                    )
+                    for code, cells in enumerate(groups)
+                ]
             else:
-                temp_args = {
-                    k: v[self._pa['values'][self._pa['rows'] - 1 - row, col]]
-                    for k, v in rectangle_args.items()
-                }
-                self.ax.add_artist(
-                    Rectangle(
-                        xy=(x, y),
-                        width=block_x_length,
-                        clip_on=False,
-                        height=block_y_length,
-                        **temp_args,
+                layer['kind'] = 'rectangles'
+                layer['collections'] = [
+                    self._draw_rectangles(
+                        layer, cols[cells], rows[cells], collection_table[code]
+                    )
+                    for code, cells in enumerate(groups)
+                ]
+            self._layers[loc] = layer
+        else:
+            x = x_full * cols
+            y = y_full * rows
+            x_center = x + block_x_length * (1 / 2 + self._pa['x_offset'])
+            y_center = y + block_y_length * (1 / 2 + self._pa['y_offset'])
+            for i, code in enumerate(cell_codes):
+                if self._pa['icons']:
+                    self.ax.text(
+                        x=x_center[i],
+                        y=y_center[i],
+                        s=icon_table[code],
+                        color=color_table[code],
+                        fontproperties=prop,
+                        horizontalalignment='center',
+                        verticalalignment='center',
+                        rotation=rotation_table[code] if rotation_table else None,
+                    )
+                elif self._pa['show_num']:
+                    self.ax.text(
+                        x=x_center[i],
+                        y=y_center[i],
+                        s=str(categories[code]),
+                        color=color_table[code],
+                        fontproperties=prop,
+                        horizontalalignment='center',
+                        verticalalignment='center',
+                    )
+                elif self._pa['marker']:
+                    self.ax.plot(
+                        x_center[i],
+                        y_center[i],
+                        color=color_table[code],
+                        marker=marker_table[code],
+                        **self._pa['marker_args'],
+                    )
+                else:
+                    self.ax.add_artist(
+                        Rectangle(
+                            xy=(x[i], y[i]),
+                            width=block_x_length,
+                            clip_on=False,
+                            height=block_y_length,
+                            **rectangle_table[code],
+                        )
                     )
-                )
 
         # Add title
         if self._pa['title'] is not None:
             self.ax.set_title(**self._pa['title'])
 
         # Add legend
+        legend_colors = [self._pa['colors'][i] for i in element]
+        if self._pa['icons']:
+            legend_icons = [self._pa['icons'][i] for i in element]
         if self._pa['labels'] or 'labels' in self._pa['legend']:
             if self._pa['icons'] and self._pa['icon_legend']:
                 self._pa['legend']['handles'] = [
                     TextLegend(color=c, text=i)
-                    for c, i in zip(self._pa['colors'], self._pa['icons'])
+                    for c, i in zip(legend_colors, legend_icons)
                 ]
                 self._pa['legend']['handler_map'] = {
                     TextLegend: TextLegendHandler(self._pa['icon_set'])
@@ -508,7 +728,7 @@ class Waffle(Figure):
             elif 'handles' not in self._pa['legend']:
                 self._pa['legend']['handles'] = [
                     Patch(color=c, label=str(l))
-                    for c, l in zip(self._pa['colors'], self._pa['labels'])
+                    for c, l in zip(legend_colors, self._pa['labels'])
                 ]
 
             # labels is an alias of legend['labels']
@@ -521,5 +741,221 @@ class Waffle(Figure):
         # Remove borders, ticks, etc.
         self.ax.axis('off')
 
+    def _cell_grid(self, visible, column_order, row_order):
+        """
+        Column and row indices of the visible blocks in plotting order.
+
+        Parameters
+        ----------
+        visible : numpy.ndarray
+            Boolean mask of the values to be plotted.
+        column_order, row_order : int
+            1 or -1, the plotting order of columns and rows.
+
+        Returns
+        -------
+        tuple
+            (cols, rows) arrays of the visible blocks, where rows count from
+            the bottom of the plot.
+        """
+        n_rows, n_columns = visible.shape[:2]
+        # blocks indexed as [col, row], flipped into plotting order
+        cols, rows = np.nonzero(visible[::-1].T[::column_order, ::row_order])
+        if column_order < 0:
+            cols = n_columns - 1 - cols
+        if row_order < 0:
+            rows = n_rows - 1 - rows
+        return cols, rows
+
+    def _group_cells(self, cell_codes, n_categories):
+        """
+        Split block indices by category, keeping the plotting order.
+
+        Parameters
+        ----------
+        cell_codes : numpy.ndarray
+            The index of each block's category.
+        n_categories : int
+            The number of categories, some of which may have no blocks.
+
+        Returns
+        -------
+        list of numpy.ndarray
+            The indices of the blocks of each category in element.
+        """
+        order = np.argsort(cell_codes, kind='stable')
+        splits = np.searchsorted(
+            cell_codes[order], np.arange(1, n_categories), side='left'
+        )
+        return np.split(order, splits)
+
+    def _rectangle_verts(self, layer, cols, rows):
+        """
+        Corner vertices of the blocks at the given columns and rows.
+        """
+        x0 = layer['x_full'] * cols
+        y0 = layer['y_full'] * rows
+        x1 = x0 + layer['block_x_length']
+        y1 = y0 + layer['block_y_length']
+        return np.stack(
+            [
+                np.column_stack([x0, y0]),
+                np.column_stack([x1, y0]),
+                np.column_stack([x1, y1]),
+                np.column_stack([x0, y1]),
+            ],
+            axis=1,
+        )
+
+    def _icon_offsets(self, layer, cols, rows):
+        """
+        Icon centers of the blocks at the given columns and rows.
+        """
+        return np.column_stack(
+            [
+                layer['x_full'] * cols
+                + layer['block_x_length'] * (1 / 2 + layer['x_offset']),
+                layer['y_full'] * rows
+                + layer['block_y_length'] * (1 / 2 + layer['y_offset']),
+            ]
+        )
+
+    def _draw_rectangles(self, layer, cols, rows, args):
+        """
+        Draw the blocks of one category as a PolyCollection.
+        """
+        return self.ax.add_collection(
+            PolyCollection(
+                self._rectangle_verts(layer, cols, rows), clip_on=False, **args
+            ),
+            autolim=False,
+        )
+
+    def _draw_icons(self, layer, cols, rows, icon, prop, rotation, color, transform):
+        """
+        Draw the icons of one category as a PathCollection.
+
+        The glyph is converted into a path once and stamped at the center of
+        every block through the collection offsets.
+        """
+        path = icon_path(icon, prop.get_file(), prop.get_size(), rotation)
+        return self.ax.add_collection(
+            PathCollection(
+                [path],
+                offsets=self._icon_offsets(layer, cols, rows),
+                offset_transform=self.ax.transData,
+                transform=transform,
+                facecolor=color,
+                edgecolor='none',
+                linewidth=0,
+                clip_on=False,
+            ),
+            autolim=False,
+        )
+
+    def update(self, loc, values):
+        """
+        Update the values of a subplot in place.
+
+        Only the collections of the categories whose blocks changed are
+        rebuilt, reusing the axes, styles and glyph paths of the subplot.
+        The subplot must be drawn with collection=True, and values must have
+        the same shape and contain no new categories.
+
+        Parameters
+        ----------
+        loc : int or tuple
+            The location of the subplot, as the key used in plots.
+        values : numpy.ndarray
+            The new values of the subplot.
+
+        Returns
+        -------
+        list
+            The collections that changed.
+        """
+        if loc not in self._layers:
+            raise KeyError(
+                'loc {} is not a subplot drawn with collection=True'.format(loc)
+            )
+        layer = self._layers[loc]
+        element = layer['element']
+
+        values = np.asarray(values)
+        if values.shape != layer['codes'].shape:
+            raise ValueError("Shape of values doesn't match the subplot.")
+
+        visible = visible_mask(values, layer['nan'])
+        visible_values = values[visible]
+        index = np.minimum(np.searchsorted(element, visible_values), len(element) - 1)
+        if not np.all(element[index] == visible_values):
+            raise ValueError('values contain categories not in the subplot.')
+        codes = np.full(values.shape, -1)
+        codes[visible] = index
+
+        changed = codes != layer['codes']
+        affected = np.unique(np.concatenate([codes[changed], layer['codes'][changed]]))
+        layer['codes'] = codes
+
+        artists = []
+        for code in affected[affected >= 0]:
+            cols, rows = self._cell_grid(
+                codes == code, layer['column_order'], layer['row_order']
+            )
+            collection = layer['collections'][code]
+            if layer['kind'] == 'icons':
+                collection.set_offsets(self._icon_offsets(layer, cols, rows))
+            else:
+                collection.set_verts(self._rectangle_verts(layer, cols, rows))
+            artists.append(collection)
+        return artists
+
+    def animate(self, frames, loc=None, **kwargs):
+        """
+        Animate subplots over a stream of values with update.
+
+        Frames are consumed lazily, so frames can be a generator over a long
+        time series. Blitting is enabled by default: the collections of the
+        subplots are animated over a static background, and only the subplots
+        whose blocks changed are redrawn in each frame.
+
+        Parameters
+        ----------
+        frames : iterable
+            Values of each frame. Each item is an array for the subplot at loc,
+            or a dict of {loc: values} to update several subplots.
+        loc : int or tuple, optional
+            The subplot updated by array frames. It can be omitted if only one
+            subplot is drawn with collection=True.
+        **kwargs
+            Additional arguments passed to `matplotlib.animation.FuncAnimation`,
+            e.g. interval or save_count.
+
+        Returns
+        -------
+        matplotlib.animation.FuncAnimation
+            The animation. Keep a reference to it until it is shown or saved.
+        """
+        if loc is None and len(self._layers) == 1:
+            loc = next(iter(self._layers))
+
+        def init():
+            return [c for layer in self._layers.values() for c in layer['collections']]
+
+        def draw(values):
+            if not isinstance(values, dict):
+                values = {loc: values}
+            artists = []
+            for key, value in values.items():
+                # blitting restores the whole axes, so all of its collections
+                # are redrawn once any of them changed
+                if self.update(key, value):
+                    artists.extend(self._layers[key]['collections'])
+            return artists
+
+        kwargs.setdefault('blit', True)
+        kwargs.setdefault('cache_frame_data', False)
+        return FuncAnimation(self, draw, frames=frames, init_func=init, **kwargs)
+
     def remove(self):
         pass
@@ -1,8 +1,14 @@
 import itertools
+from collections import OrderedDict
 import numpy as np
 import matplotlib as mpl
 from matplotlib.text import Text
 from matplotlib.patches import Patch
+from matplotlib.font_manager import FontProperties
+
+# legend handles and labels of category_legend, least recently used first
+_handle_cache = OrderedDict()
+_HANDLE_CACHE_SIZE = 32
 
 
 # reverse order: flip(legend_elements, ncol), flip(labels, ncol)
@@ -71,7 +77,7 @@ class AnyObjectHandler(object):
 
 
 # categorical legend: USA_Baseflow fig2_gages.py
-def cat_legend(values, cmap, vmin=None, vmax=None, **style_kwds):
+def cat_legend(values, cmap, vmin=None, vmax=None, nan_color=None, **style_kwds):
     """
     Create a categorical legend.
 
@@ -85,6 +91,9 @@ def cat_legend(values, cmap, vmin=None, vmax=None, **style_kwds):
         Minimum value for normalization.
     vmax : float, optional
         Maximum value for normalization.
+    nan_color : str, optional
+        If given and values contain NaN, a last patch of this color is added
+        for the missing values.  NaN is never a category of its own.
     **style_kwds
         Additional keyword arguments.
 
@@ -94,11 +103,15 @@ def cat_legend(values, cmap, vmin=None, vmax=None, **style_kwds):
         A list of matplotlib.patches.Patch objects.
     """
     values = np.asarray(values)
-    categories = sorted(set(values))
-    valuemap = dict((k, v) for (v, k) in enumerate(categories))
-    values = np.array([valuemap[k] for k in values])
-    mn = values[~np.isnan(values)].min() if vmin is None else vmin
-    mx = values[~np.isnan(values)].max() if vmax is None else vmax
+    categories = np.unique(values)
+    has_nan = False
+    if categories.dtype.kind in 'fc':
+        has_nan = np.isnan(categories[-1:]).any()
+        categories = categories[~np.isnan(categories)]
+
+    # every category appears, so their codes span 0 to len(categories) - 1
+    mn = 0 if vmin is None else vmin
+    mx = len(categories) - 1 if vmax is None else vmax
 
     norm = mpl.colors.Normalize(vmin=mn, vmax=mx)
     n_cmap = mpl.cm.ScalarMappable(norm=norm, cmap=cmap)
@@ -106,4 +119,136 @@ def cat_legend(values, cmap, vmin=None, vmax=None, **style_kwds):
     patches = []
     for value, cat in enumerate(categories):
         patches.append(Patch(color=n_cmap.to_rgba(value), linewidth=1))
+    if has_nan and nan_color is not None:
+        patches.append(Patch(color=nan_color, linewidth=1))
     return patches
+
+
+def _cmap_key(cmap):
+    # colormaps of the same name may differ, e.g. those of boundary_cmap
+    colors = cmap(np.r_[np.linspace(0, 1, cmap.N), -np.inf, np.inf, np.nan])
+    return type(cmap).__name__, cmap.N, colors.tobytes()
+
+
+def _norm_key(norm):
+    if norm is None:
+        return None
+    return (
+        type(norm).__name__,
+        norm.vmin,
+        norm.vmax,
+        norm.clip,
+        getattr(norm, 'extend', None),
+        getattr(norm, 'Ncmap', None),
+        tuple(np.ravel(getattr(norm, 'boundaries', ()))),
+    )
+
+
+def category_legend(
+    ax,
+    values,
+    cmap,
+    norm=None,
+    labels=None,
+    max_categories=None,
+    order='column',
+    **legend_kwds,
+):
+    """
+    Create a legend of many categories with columns packed to the axes height.
+
+    The number of columns is computed from the font size and label spacing
+    instead of measuring the legend, and the handles are cached per
+    (categories, cmap, norm).
+
+    Parameters
+    ----------
+    ax : matplotlib.axes.Axes
+        The axes of the legend.
+    values : list or numpy.ndarray
+        The values, or the categories, to show.  NaN is ignored.
+    cmap : str or matplotlib.colors.Colormap
+        The colormap used.
+    norm : matplotlib.colors.Normalize, optional
+        The norm mapping categories to colors, e.g. from `boundary_cmap`.  If
+        None, categories are colored by their rank, as in `cat_legend`.
+    labels : list or dict, optional
+        The label of each category, in sorted order or by category.  The
+        categories themselves by default.
+    max_categories : int, optional
+        If there are more categories, consecutive categories are collapsed
+        into this many ranges, labeled 'first–last' and colored by their
+        middle category.
+    order : {'column', 'row'}, optional
+        Whether handles are filled column by column (default) or row by row.
+    **legend_kwds
+        Additional arguments passed to `matplotlib.axes.Axes.legend`, e.g. ncol
+        to override the computed number of columns.
+
+    Returns
+    -------
+    matplotlib.legend.Legend
+        The legend.
+    """
+    categories = np.unique(np.asarray(values))
+    if categories.dtype.kind in 'fc':
+        categories = categories[~np.isnan(categories)]
+    if isinstance(labels, dict):
+        labels = [labels[c] for c in categories]
+    elif labels is None:
+        labels = [str(c) for c in categories]
+
+    cmap = mpl.colormaps[cmap] if isinstance(cmap, str) else cmap
+    key = (
+        tuple(categories.tolist()),
+        tuple(labels),
+        _cmap_key(cmap),
+        _norm_key(norm),
+        max_categories,
+    )
+    if key in _handle_cache:
+        _handle_cache.move_to_end(key)
+        handles, labels = _handle_cache[key]
+    else:
+        if norm is None:
+            colors = cmap(
+                mpl.colors.Normalize(0, max(len(categories) - 1, 1))(
+                    np.arange(len(categories))
+                )
+            )
+        else:
+            colors = cmap(norm(categories))
+
+        groups = np.arange(len(categories))
+        if max_categories is not None and len(categories) > max_categories:
+            groups = np.array_split(groups, max_categories)
+            colors = [colors[g[len(g) // 2]] for g in groups]
+            labels = [
+                labels[g[0]] if len(g) == 1 else f'{labels[g[0]]}–{labels[g[-1]]}'
+                for g in groups
+            ]
+        handles = [Patch(color=c, linewidth=1) for c in colors]
+        _handle_cache[key] = handles, labels
+        if len(_handle_cache) > _HANDLE_CACHE_SIZE:
+            _handle_cache.popitem(last=False)
+
+    # rows fitting in the axes height, in points
+    fontsize = FontProperties(
+        size=legend_kwds.get('fontsize', mpl.rcParams['legend.fontsize'])
+    ).get_size_in_points()
+    labelspacing = legend_kwds.get('labelspacing', mpl.rcParams['legend.labelspacing'])
+    borderpad = legend_kwds.get('borderpad', mpl.rcParams['legend.borderpad'])
+    height = ax.get_window_extent().height * 72 / ax.figure.dpi
+    nrow = max(
+        int(
+            (height - 2 * borderpad * fontsize + labelspacing * fontsize)
+            // ((1 + labelspacing) * fontsize)
+        ),
+        1,
+    )
+    ncol = legend_kwds.pop('ncol', -(-len(handles) // nrow))
+
+    if order == 'row':
+        handles = list(flip(handles, ncol))
+        labels = list(flip(labels, ncol))
+    return ax.legend(handles, labels, ncol=ncol, **legend_kwds)
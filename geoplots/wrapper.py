@@ -1,7 +1,32 @@
+import os
 import matplotlib.pyplot as plt
+import matplotlib.font_manager as fm
 from geoplots._const import params
 from matplotlib.transforms import Bbox
 
+_FONT_DIR = os.path.join(os.path.dirname(__file__), 'fonts')
+_fonts_registered = False
+
+
+def register_fonts():
+    """
+    Register the bundled Roboto fonts with matplotlib.
+
+    Fonts are parsed on the first call only, and files already known to the
+    font manager (e.g. inherited by a forked process) are skipped. `init` and
+    the first access to `geoplots.params` call it, so it is only needed when
+    params is imported from `geoplots._const` directly.
+    """
+    global _fonts_registered
+    if _fonts_registered:
+        return
+    registered = {font.fname for font in fm.fontManager.ttflist}
+    for font_file in sorted(os.listdir(_FONT_DIR)):
+        path = os.path.join(_FONT_DIR, font_file)
+        if font_file.endswith('.ttf') and path not in registered:
+            fm.fontManager.addfont(path)
+    _fonts_registered = True
+
 
 def init(
     figsize,
@@ -40,6 +65,7 @@ def init(
     tuple
         (fig, grids) where fig is the Figure and grids is the GridSpec.
     """
+    register_fonts()
     plt.rcParams.update(params)
     fig = plt.figure(figsize=figsize, **kwargs)
     ncols = 1 if widths is None else len(widths)